@@ -15,8 +15,8 @@ def single_process(process_func, search_processes_infos):
 def multiprocessing_wrapper(process_func, search_processes_paras, **kwargs):
     n_jobs = len(search_processes_paras)
 
-    pool = Pool(n_jobs, **kwargs)
-    results = pool.map(process_func, search_processes_paras)
+    with Pool(n_jobs, **kwargs) as pool:
+        results = pool.map(process_func, search_processes_paras)
 
     return results
 
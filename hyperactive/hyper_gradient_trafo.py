@@ -6,6 +6,26 @@ import numpy as np
 import pandas as pd
 
 
+def value2position_dict(search_dim):
+    value2pos = {}
+    try:
+        for pos, value in enumerate(search_dim):
+            value2pos.setdefault(value, pos)
+    except TypeError:
+        # unhashable values in the search space
+        return None
+
+    return value2pos
+
+
+def get_position(value2pos, value):
+    try:
+        return value2pos.get(value)
+    except TypeError:
+        # unhashable values can not be in a hashable search space
+        return None
+
+
 class Converter:
     def __init__(self, search_space):
         self.search_space = search_space
@@ -17,7 +37,7 @@ class Converter:
             pos = np.abs(value[n] - space_dim).argmin()
             position.append(pos)
 
-        return np.array(position).astype(int)
+        return np.array(position, dtype=int)
 
     def value2para(self, value):
         para = {}
@@ -49,7 +69,7 @@ class HyperGradientTrafo(Converter):
 
         search_space_positions = {}
         for key in search_space.keys():
-            search_space_positions[key] = np.array(range(len(search_space[key])))
+            search_space_positions[key] = np.arange(len(search_space[key]))
         self.search_space_positions = search_space_positions
 
     def trafo_initialize(self, initialize):
@@ -76,10 +96,17 @@ class HyperGradientTrafo(Converter):
             list1_values = list(results[para_name].values)
 
             search_dim = self.search_space[para_name]
-            list1_positions = [
-                search_dim.index(value) if value in search_dim else None
-                for value in list1_values
-            ]
+            value2pos = value2position_dict(search_dim)
+
+            if value2pos is None:
+                list1_positions = [
+                    search_dim.index(value) if value in search_dim else None
+                    for value in list1_values
+                ]
+            else:
+                list1_positions = [
+                    get_position(value2pos, value) for value in list1_values
+                ]
 
             # remove None
             list1_positions_ = [x for x in list1_positions if x is not None]
@@ -4,6 +4,8 @@
 
 
 import multiprocessing
+import numpy as np
+import pandas as pd
 from tqdm import tqdm
 
 from .optimizers import RandomSearchOptimizer
@@ -112,54 +114,38 @@ class Hyperactive:
             search_id,
         )
 
-    def _sort_results_objFunc(self, objective_function):
-        import numpy as np
-        import pandas as pd
-
-        best_score = -np.inf
-        best_para = None
-        results_list = []
-
-        for results in self.results_list:
-            nth_process = results["nth_process"]
-
-            process_infos = self.process_infos[nth_process]
-            objective_function_ = process_infos["objective_function"]
-
-            if objective_function_ != objective_function:
-                continue
-
-            if results["best_score"] > best_score:
-                best_score = results["best_score"]
-                best_para = results["best_para"]
+    def _add_result(self, id2results, id_, results):
+        if id_ not in id2results:
+            id2results[id_] = {
+                "best_para": None,
+                "best_score": -np.inf,
+                "results": [],
+            }
+        id_results = id2results[id_]
 
-            results_list.append(results["results"])
+        if results["best_score"] > id_results["best_score"]:
+            id_results["best_score"] = results["best_score"]
+            id_results["best_para"] = results["best_para"]
 
-        results = pd.concat(results_list)
+        id_results["results"].append(results["results"])
 
-        self.objFunc2results[objective_function] = {
-            "best_para": best_para,
-            "best_score": best_score,
-            "results": results,
-        }
+    def _sort_results(self):
+        self.objFunc2results = {}
+        self.search_id2results = {}
 
-    def _sort_results_search_id(self, search_id):
         for results in self.results_list:
             nth_process = results["nth_process"]
-            search_id_ = self.process_infos[nth_process]["search_id"]
 
-            if search_id_ != search_id:
-                continue
+            process_infos = self.process_infos[nth_process]
+            objective_function = process_infos["objective_function"]
+            search_id = process_infos["search_id"]
 
-            best_score = results["best_score"]
-            best_para = results["best_para"]
-            results = results["results"]
+            self._add_result(self.objFunc2results, objective_function, results)
+            self._add_result(self.search_id2results, search_id, results)
 
-            self.search_id2results[search_id] = {
-                "best_para": best_para,
-                "best_score": best_score,
-                "results": results,
-            }
+        for id2results in (self.objFunc2results, self.search_id2results):
+            for id_results in id2results.values():
+                id_results["results"] = pd.concat(id_results["results"])
 
     def run(
         self, max_time=None,
@@ -168,18 +154,12 @@ class Hyperactive:
             self.process_infos[nth_process]["max_time"] = max_time
 
         self.results_list = run_search(self.process_infos, self.distribution)
+        self._sort_results()
 
     def _get_one_result(self, id_, result_name):
         if isinstance(id_, str):
-            if id_ not in self.search_id2results:
-                self._sort_results_search_id(id_)
-
             return self.search_id2results[id_][result_name]
-
         else:
-            if id_ not in self.objFunc2results:
-                self._sort_results_objFunc(id_)
-
             return self.objFunc2results[id_][result_name]
 
     def best_para(self, id_):
@@ -85,8 +85,8 @@ class _BaseOptimizer_(DictClass):
         return memory_warm_start
 
     def _convert_results2hyper(self):
-        self.eval_time = np.array(self.optimizer.eval_times).sum()
-        self.iter_time = np.array(self.optimizer.iter_times).sum()
+        self.eval_time = sum(self.optimizer.eval_times)
+        self.iter_time = sum(self.optimizer.iter_times)
 
         value = self.trafo.para2value(
             self.optimizer.best_para
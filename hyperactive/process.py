@@ -3,11 +3,11 @@
 # License: MIT License
 
 
-def gfo2hyper(search_space, para):
+def gfo2hyper(search_space_items, para):
     values_dict = {}
-    for i, key in enumerate(search_space.keys()):
+    for key, values in search_space_items:
         pos_ = int(para[key])
-        values_dict[key] = search_space[key][pos_]
+        values_dict[key] = values[pos_]
 
     return values_dict
 
@@ -26,10 +26,12 @@ def _process_(
     verbosity,
     **kwargs
 ):
+    search_space_items = list(search_space.items())
+
     def gfo_wrapper_model():
         # wrapper for GFOs
         def _model(para):
-            para = gfo2hyper(search_space, para)
+            para = gfo2hyper(search_space_items, para)
             optimizer.para_dict = para
             return objective_function(optimizer)
 
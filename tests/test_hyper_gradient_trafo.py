@@ -142,6 +142,46 @@ def test_trafo_1(random_state, search_space, memory_warm_start):
     assert d_time_1 < d_time_0 * 0.8
 
 
+# ----------------- # Test conversion of memory warm starts into positions
+
+
+from hyperactive.hyper_gradient_trafo import HyperGradientTrafo
+
+
+def test_trafo_memory_warm_start_duplicates():
+    search_space = {"x1": [1, 2, 1, 3]}
+    memory_warm_start = pd.DataFrame({"x1": [1, 3], "score": [0.1, 0.2]})
+
+    trafo = HyperGradientTrafo(search_space)
+    results = trafo.trafo_memory_warm_start(memory_warm_start)
+
+    assert list(results["x1"]) == [0, 3]
+    assert list(results["score"]) == [0.1, 0.2]
+
+
+def test_trafo_memory_warm_start_unhashable():
+    search_space = {"x1": [[1, 2], [3, 4], [1, 2]]}
+    memory_warm_start = pd.DataFrame(
+        {"x1": [[3, 4], [1, 2]], "score": [0.1, 0.2]}
+    )
+
+    trafo = HyperGradientTrafo(search_space)
+    results = trafo.trafo_memory_warm_start(memory_warm_start)
+
+    assert list(results["x1"]) == [1, 0]
+    assert list(results["score"]) == [0.1, 0.2]
+
+
+def test_trafo_memory_warm_start_array():
+    search_space = {"x1": np.arange(10, 20)}
+    memory_warm_start = pd.DataFrame({"x1": [12, 15], "score": [0.1, 0.2]})
+
+    trafo = HyperGradientTrafo(search_space)
+    results = trafo.trafo_memory_warm_start(memory_warm_start)
+
+    assert list(results["x1"]) == [2, 5]
+
+
 # ----------------- # Test if wrong memory warm starts do not work as intended
 
 search_space_0 = {
@@ -156,3 +156,48 @@ def test_attributes_results_search_id_1():
     hyper.run()
 
     assert isinstance(hyper.results("1"), pd.DataFrame)
+
+
+def test_attributes_search_id_n_processes_0():
+    hyper = Hyperactive(distribution="joblib")
+    hyper.add_search(
+        objective_function, search_space, search_id="1", n_iter=15,
+    )
+    hyper.add_search(
+        objective_function, search_space, search_id="1", n_iter=15,
+    )
+    hyper.run()
+
+    best_scores = [results["best_score"] for results in hyper.results_list]
+    n_results = sum(len(results["results"]) for results in hyper.results_list)
+
+    assert len(hyper.results_list) == 2
+    assert hyper.best_score("1") == max(best_scores)
+    assert len(hyper.results("1")) == n_results
+
+
+def test_attributes_repeated_run_0():
+    hyper = Hyperactive(distribution="joblib")
+    hyper.add_search(
+        objective_function, search_space, search_id="1", n_iter=15,
+    )
+    hyper.run()
+
+    n_results_0 = len(hyper.results(objective_function))
+
+    hyper.add_search(
+        objective_function, search_space, search_id="1", n_iter=15,
+    )
+    hyper.run()
+
+    best_scores = [results["best_score"] for results in hyper.results_list]
+    n_results = sum(len(results["results"]) for results in hyper.results_list)
+
+    assert len(hyper.results_list) == 2
+    assert n_results > n_results_0
+
+    assert hyper.best_score(objective_function) == max(best_scores)
+    assert len(hyper.results(objective_function)) == n_results
+
+    assert hyper.best_score("1") == max(best_scores)
+    assert len(hyper.results("1")) == n_results